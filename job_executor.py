@@ -29,7 +29,6 @@
 #       Read in a command file containing operations to run in parallel.
 #
 #   Library Dependencies:
-#       - psutil
 #       - PyYAML
 #
 #   Usage:
@@ -47,16 +46,26 @@ import sys
 sys.dont_write_bytecode = True
 import os
 import argparse
+import asyncio
+import concurrent.futures
 import datetime
-import psutil
+import multiprocessing
+import operator
 import re
 import shlex
+import signal
 import subprocess
 import threading
 import time
 import traceback
 import yaml
 
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 #------------------------------------------------------------------------------
 # Default Global Settings
@@ -82,12 +91,33 @@ STRATEGY = "priority"
 # Field ignored when using wall_time or sequential scheduling strategies.
 PRIORITY = 100
 
+# Methodology used to execute job items in parallel.
+#
+# Executors:
+# - process:    Execute job items from a pool of worker processes.
+# - async:      Execute job items from a single asyncio event loop.  Suited
+#               to a large number of parallel job items.
+EXECUTOR = "process"
+
+# Queue used by executor worker processes to send console messages
+_log_queue = None
+
+# Event set in executor worker processes once no further job items may start
+_stop_event = None
+
 
 #------------------------------------------------------------------------------
 # JobItem Class
 #------------------------------------------------------------------------------
 class JobItem:
 
+    # Fixed attribute layout, avoids a per instance __dict__
+    __slots__ = (
+        "name", "index", "command", "priority", "wall_time", "stdout",
+        "stderr", "exit_code", "job_state", "create_time", "start_time",
+        "end_time"
+    )
+
     #--------------------------------------------------------------------------
     # Function: __init__
     # JobItem object constructor.
@@ -124,20 +154,22 @@ class JobItem:
     # string - String represenation of the job item
     #--------------------------------------------------------------------------
     def __str__(self):
-        msg =  "Job Item:\n"
-        msg += "  Name:       %s\n"  % self.name
-        msg += "  Index:      %1d\n" % self.index
-        msg += "  Priority:   %1d\n" % self.priority
-        msg += "  Wall Time:  %s\n"  % self.wall_time
-        msg += "  Command:    %s\n"  % self.command
-        msg += "  stdout:     %s\n"  % self.stdout
-        msg += "  stderr:     %s\n"  % self.stderr
-        msg += "  Job State:  %s\n"  % self.job_state
-        msg += "  Exit Code:  %s\n"  % self.exit_code
+        msg = (
+            f"Job Item:\n"
+            f"  Name:       {self.name}\n"
+            f"  Index:      {self.index:d}\n"
+            f"  Priority:   {self.priority:d}\n"
+            f"  Wall Time:  {self.wall_time}\n"
+            f"  Command:    {self.command}\n"
+            f"  stdout:     {self.stdout}\n"
+            f"  stderr:     {self.stderr}\n"
+            f"  Job State:  {self.job_state}\n"
+            f"  Exit Code:  {self.exit_code}\n"
+        )
         if self.start_time:
-            msg += "  Start Time: %s\n"  % self.start_time
+            msg += f"  Start Time: {self.start_time}\n"
         if self.end_time:
-            msg += "  End Time:   %s\n"  % self.end_time
+            msg += f"  End Time:   {self.end_time}\n"
         return msg
 
 
@@ -160,9 +192,9 @@ class DataMap:
     @staticmethod
     def load_yaml(yaml_file):
         data_map = None
-        with open(yaml_file, "r") as stream:
+        with open(yaml_file, "rb") as stream:
             try:
-                data_map = yaml.safe_load(stream)
+                data_map = yaml.load(stream, Loader=YamlLoader)
             except yaml.YAMLError as exc:
                 print(exc)
 
@@ -183,6 +215,7 @@ class GlobalSettings:
         self.wall_time = WALL_TIME
         self.strategy = STRATEGY
         self.priority = PRIORITY
+        self.executor = EXECUTOR
 
     #--------------------------------------------------------------------------
     # Function: load
@@ -206,6 +239,8 @@ class GlobalSettings:
             settings.strategy = data_map["global"]["strategy"]
         if "priority" in data_map["global"]:
             settings.priority = data_map["global"]["priority"]
+        if "executor" in data_map["global"]:
+            settings.executor = data_map["global"]["executor"]
 
         return settings
 
@@ -220,82 +255,137 @@ class JobsParser:
     # Parse Job Items, convert to an JobItem object.
     #
     # Parameters:
-    # data_map - Yaml data object map
-    # job_type - Job type to return
-    # settings - Optional GlobalSettings object
+    # data_map  - Yaml data object map
+    # job_type  - Job type to return
+    # settings  - Optional GlobalSettings object
+    # job_names - Optional set of job names already in use
+    # defaults  - Optional default priority and wall time tuple
     #
     # Returns:
     # list - A list of job items of the provided job type
     #--------------------------------------------------------------------------
     @staticmethod
-    def parse(data_map, job_type, settings=None):
-        job_items = []
-        job_item = None
-        index = 0
+    def parse(data_map, job_type, settings=None, job_names=None, defaults=None):
+        # Nothing to parse for an empty job type
+        entries = data_map[job_type]
+        if not entries:
+            return []
 
-        # Create a setting class if one is not provided
-        if settings is None:
-            settings = GlobalSettings()
+        # Default field values shared by all job items
+        if defaults is None:
+            defaults = JobsParser.parse_defaults(settings)
+        default_priority, default_wall_time = defaults
 
         # Add each job item to a list of job items of the provided job type
-        for i in data_map[job_type]:
+        job_items = [None] * len(entries)
+        for index, i in enumerate(entries):
 
             # Required name
-            if "job" in i:
-                name = i["job"]
-            else:
+            name = i.get("job")
+            if name is None:
                 print ("ERROR: Required \"job\" field not defined for Job Item")
                 sys.exit(1)
 
             # Required Command
-            if "command" in i:
-                command = i["command"]
-            else:
+            command = i.get("command")
+            if command is None:
                 print ("ERROR: Required \"command\" field not defined for Job Item")
                 sys.exit(1)
+            if not isinstance(command, str):
+                print ("ERROR: \"command\" field of Job Item \"" + str(name) + "\" must be a string")
+                sys.exit(1)
 
             # Optional Priority
-            priority = settings.priority
-            if "priority" in i:
-                priority = i["priority"]
+            priority = i.get("priority", default_priority)
 
             # Optional Max Wall Time
-            wall_time = int(settings.wall_time)
-            if "wall_time" in i:
-                if isinstance(i["wall_time"], int):
-                    wall_time = int(i["wall_time"])
-                if isinstance(i["wall_time"], float):
-                    wall_time = int(i["wall_time"])
-                if isinstance(i["wall_time"], str):
-                    h, m, s = i["wall_time"].split(':')
-                    wall_time = int(h) * 3600 + int(m) * 60 + int(s)
+            wall_time = i.get("wall_time")
+            if wall_time is None:
+                wall_time = default_wall_time
+            else:
+                wall_time = JobsParser.parse_wall_time(wall_time)
 
             # Optional stdout
-            stdout = name + ".out"
-            if "stdout" in i:
-                stdout = i["stdout"]
+            stdout = i.get("stdout")
+            if stdout is None:
+                stdout = name + ".out"
 
             # Optional stderr
-            stderr = name + ".err"
-            if "stderr" in i:
-                stderr = i["stderr"]
+            stderr = i.get("stderr")
+            if stderr is None:
+                stderr = name + ".err"
 
-            job_item = JobItem(name, index, command, priority, wall_time, stdout, stderr)
-            job_items.append(job_item)
-            index += 1
+            job_items[index] = JobItem(name, index, command, priority, wall_time, stdout, stderr)
 
         # Validate the job names
-        job_names = []
+        if job_names is None:
+            job_names = set()
         for job in job_items:
-            if job.name not in job_names:
-                job_names.append(job.name)
-            else:
+            if job.name in job_names:
                 print("ERROR: Duplicate Job Name: \"" + job.name + "\"")
                 sys.exit(1)
-        job_names = []
+            job_names.add(job.name)
 
         return job_items
 
+    #--------------------------------------------------------------------------
+    # Function: parse_all
+    # Parse the pre, main, and post Job Items in a single pass.  Job names
+    # must be unique across all three job types.
+    #
+    # Parameters:
+    # data_map - Yaml data object map
+    # settings - Optional GlobalSettings object
+    #
+    # Returns:
+    # tuple - Lists of the pre, main, and post job items
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def parse_all(data_map, settings=None):
+        job_names = set()
+        defaults = JobsParser.parse_defaults(settings)
+
+        pre_job_items  = JobsParser.parse(data_map, "pre_job_items", settings, job_names, defaults)
+        job_items      = JobsParser.parse(data_map, "job_items", settings, job_names, defaults)
+        post_job_items = JobsParser.parse(data_map, "post_job_items", settings, job_names, defaults)
+
+        return pre_job_items, job_items, post_job_items
+
+    #--------------------------------------------------------------------------
+    # Function: parse_defaults
+    # Determine the default priority and wall time of job items.
+    #
+    # Parameters:
+    # settings - Optional GlobalSettings object
+    #
+    # Returns:
+    # tuple - Default priority and wall time in seconds
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def parse_defaults(settings=None):
+        # Create a setting class if one is not provided
+        if settings is None:
+            settings = GlobalSettings()
+
+        return settings.priority, JobsParser.parse_wall_time(settings.wall_time)
+
+    #--------------------------------------------------------------------------
+    # Function: parse_wall_time
+    # Convert a wall time to seconds.
+    #
+    # Parameters:
+    # wall_time - Wall time in seconds or in HH:MM:SS format
+    #
+    # Returns:
+    # int - Wall time in seconds
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def parse_wall_time(wall_time):
+        if type(wall_time) is str:
+            h, m, s = map(int, wall_time.split(':', 2))
+            return h * 3600 + m * 60 + s
+        return int(wall_time)
+
 
 #------------------------------------------------------------------------------
 # JobsScheduler Class
@@ -304,7 +394,7 @@ class JobsScheduler:
 
     #--------------------------------------------------------------------------
     # Function: sequential_schedule
-    # Reorder job items list based on index.
+    # Reorder job items list in place based on index.
     #
     # Parameters:
     # job_items - List of job items
@@ -314,12 +404,14 @@ class JobsScheduler:
     #--------------------------------------------------------------------------
     @staticmethod
     def sequential_schedule(job_items):
-        ordered_job_items = sorted(job_items, key=lambda h: (h.index))
-        return ordered_job_items
+        if len(job_items) < 2:
+            return job_items
+        job_items.sort(key=operator.attrgetter("index"))
+        return job_items
 
     #--------------------------------------------------------------------------
     # Function: priority_schedule
-    # Reorder job items list based on priority.
+    # Reorder job items list in place based on priority.
     #
     # Parameters:
     # job_items - List of job items
@@ -329,16 +421,17 @@ class JobsScheduler:
     #--------------------------------------------------------------------------
     @staticmethod
     def priority_schedule(job_items):
-        ordered_job_items = sorted(
-            job_items,
-            key=lambda h: (h.priority, h.name),
+        if len(job_items) < 2:
+            return job_items
+        job_items.sort(
+            key=operator.attrgetter("priority", "name"),
             reverse=True
         )
-        return ordered_job_items
+        return job_items
 
     #--------------------------------------------------------------------------
     # Function: wall_time_schedule
-    # Reorder job items list based on wall times.
+    # Reorder job items list in place based on wall times.
     #
     # Parameters:
     # job_items - List of job items
@@ -348,12 +441,13 @@ class JobsScheduler:
     #--------------------------------------------------------------------------
     @staticmethod
     def wall_time_schedule(job_items):
-        ordered_job_items = sorted(
-            job_items,
-            key=lambda h: (h.wall_time, h.name),
+        if len(job_items) < 2:
+            return job_items
+        job_items.sort(
+            key=operator.attrgetter("wall_time", "name"),
             reverse=True
         )
-        return ordered_job_items
+        return job_items
 
 
 #------------------------------------------------------------------------------
@@ -369,39 +463,93 @@ class JobsExecutor:
     # job_items   - List of job items
     # num_threads - Number of parallel threads
     #--------------------------------------------------------------------------
-    @classmethod
-    def execute(cls, job_items, num_threads):
-        cls = JobsExecutor()
-        thread_list = []
+    @staticmethod
+    def execute(job_items, num_threads):
 
-        # Execute job items
-        for job in job_items:
+        # Console messages from the workers are written by a single thread
+        log_queue = multiprocessing.SimpleQueue()
+        log_thread = threading.Thread(target=JobsExecutor.write_log, args=(log_queue,), daemon=True)
+        log_thread.start()
 
-            # Determine if the next thread can start
-            while True:
-                # Get the number of running threads
-                running_threads = 0
-                for x in thread_list:
-                    # Thread is alive
-                    if x.is_alive():
-                        running_threads += 1
+        # Set to stop the workers from starting job items that were already
+        # handed to them
+        stop_event = multiprocessing.Event()
 
-                # Running threads is below threshold
-                if (running_threads < num_threads):
-                    break
-                # Running threads at threshold
-                else:
-                    time.sleep(0.25)
+        # Execute job items, the pool limits the number of running job items.
+        # Each worker is a separate process so that job item bookkeeping is
+        # not serialized behind the interpreter lock.
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_threads,
+                initializer=JobsExecutor.init_worker,
+                initargs=(log_queue, stop_event)
+            ) as pool:
+                try:
+                    futures = [pool.submit(JobsExecutor.execute_job, job) for job in job_items]
+
+                    # Wait for all remaining job items to complete and copy the
+                    # end of job state back from the worker's copy of each job item
+                    for job_item, future in zip(job_items, futures):
+                        result = future.result()
+                        job_item.exit_code  = result.exit_code
+                        job_item.job_state  = result.job_state
+                        job_item.start_time = result.start_time
+                        job_item.end_time   = result.end_time
+
+                # Do not start queued job items after a break
+                except KeyboardInterrupt:
+                    stop_event.set()
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    raise
+        finally:
+            log_queue.put(None)
+            log_thread.join()
 
-            # Start next thread
-            x = threading.Thread(target=cls.execute_job, kwargs={'job_item': job}, daemon=True)
-            thread_list.append(x)
-            x.start()
+    #--------------------------------------------------------------------------
+    # Function: init_worker
+    # Initialize an executor worker process.
+    #
+    # Parameters:
+    # log_queue  - Queue used to send console messages to the main process
+    # stop_event - Event set once no further job items may start
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def init_worker(log_queue, stop_event):
+        global _log_queue, _stop_event
+        _log_queue = log_queue
+        _stop_event = stop_event
 
-        # Wait for all remaining threads to complete
-        for x in thread_list:
-            x.join()
+    #--------------------------------------------------------------------------
+    # Function: log
+    # Send a console message to the main process, or write it directly when
+    # not running in an executor worker process.
+    #
+    # Parameters:
+    # msg - Console message
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def log(msg):
+        if _log_queue is None:
+            sys.stdout.write(msg + "\n")
+            sys.stdout.flush()
+        else:
+            _log_queue.put(msg)
 
+    #--------------------------------------------------------------------------
+    # Function: write_log
+    # Write console messages until a None message is received.  Output is
+    # flushed once the queue has been drained.
+    #
+    # Parameters:
+    # log_queue - Queue of console messages
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def write_log(log_queue):
+        for msg in iter(log_queue.get, None):
+            sys.stdout.write(msg + "\n")
+            if log_queue.empty():
+                sys.stdout.flush()
+        sys.stdout.flush()
 
     #--------------------------------------------------------------------------
     # Function: execute_job
@@ -409,57 +557,279 @@ class JobsExecutor:
     #
     # Parameters:
     # job_item - Job Item to Execute
+    #
+    # Returns:
+    # job_item - Executed job item
     #--------------------------------------------------------------------------
-    def execute_job(self, job_item):
-        command = job_item.command + " > " + job_item.stdout + " 2> " + job_item.stderr
-        job_item.start_time = datetime.datetime.now()
-        job_item.job_state  = "EXECUTING"
+    @staticmethod
+    def execute_job(job_item):
+        # Skip job items handed to the worker after a break was requested
+        if _stop_event is not None and _stop_event.is_set():
+            return job_item
 
-        # Update console message
-        msg  = "[" + str(job_item.start_time) + "] "
-        msg += "{job_state: " + job_item.job_state
-        msg += ", job: " + job_item.name
-        msg += ", command: " + str(command)+ "}"
-        print(msg)
+        start_mono = JobsExecutor.start_job(job_item)
 
-        # Execute Job Item
+        # Execute Job Item, output is redirected directly to the job item's
+        # stdout and stderr files without an intermediate shell
         timeout = False
-        p = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-        pid = p.pid
+        try:
+            argv, stdout, stderr = JobsExecutor.prepare_job(job_item)
+            try:
+                p = subprocess.Popen(argv, stdout=stdout, stderr=stderr, start_new_session=True)
+            finally:
+                stdout.close()
+                stderr.close()
+        except Exception as exc:
+            JobsExecutor.fail_job(job_item, exc, start_mono)
+            return job_item
 
         # Handle Time-outs and terminations
         try:
-            stdout, stderr = p.communicate(timeout=int(job_item.wall_time))
+            p.wait(timeout=int(job_item.wall_time))
         except subprocess.TimeoutExpired:
-            process = psutil.Process(pid)
-            for proc in process.children(recursive=True):
-                proc.kill()
-            process.kill()
-            stdout, stderr = p.communicate()
+            JobsExecutor.kill_job(p.pid)
+            p.wait()
             timeout = True
+        except KeyboardInterrupt:
+            if _stop_event is not None:
+                _stop_event.set()
+            JobsExecutor.kill_job(p.pid)
+            p.wait()
+            raise
+        except Exception as exc:
+            JobsExecutor.kill_job(p.pid)
+            p.wait()
+            JobsExecutor.fail_job(job_item, exc, start_mono)
+            return job_item
 
         # Capture end of job state
-        job_item.exit_code = p.returncode
-        job_item.end_time  = datetime.datetime.now()
         if timeout:
-            job_state = "TIMEOUT"
+            JobsExecutor.end_job(job_item, "TIMEOUT", p.returncode, start_mono)
         else:
-            job_state = "COMPLETED"
-        job_item.job_state = job_state
+            JobsExecutor.end_job(job_item, "COMPLETED", p.returncode, start_mono)
+
+        return job_item
+
+    #--------------------------------------------------------------------------
+    # Function: prepare_job
+    # Split a job item's command into arguments and open its stdout and
+    # stderr files.  The caller is responsible for closing the files.
+    #
+    # Parameters:
+    # job_item - Job Item to prepare
+    #
+    # Returns:
+    # tuple - Command arguments, stdout file, and stderr file
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def prepare_job(job_item):
+        argv = shlex.split(job_item.command)
+        if not argv:
+            raise ValueError("No command to execute")
+
+        stdout = open(job_item.stdout, "wb")
+        try:
+            stderr = open(job_item.stderr, "wb")
+        except OSError:
+            stdout.close()
+            raise
+
+        return argv, stdout, stderr
+
+    #--------------------------------------------------------------------------
+    # Function: kill_job
+    # Kill a job item and any processes it started.  The job item leads its
+    # own process group, so the whole group is killed.
+    #
+    # Parameters:
+    # pid - Process ID of the job item
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def kill_job(pid):
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    #--------------------------------------------------------------------------
+    # Function: fail_job
+    # Record a job item that could not be launched or executed.  The error is
+    # written to the job item's stderr file, or to the console if that file
+    # cannot be written.
+    #
+    # Parameters:
+    # job_item   - Job Item that failed
+    # exc        - Exception raised while executing the job item
+    # start_mono - Monotonic clock time the job item started
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def fail_job(job_item, exc, start_mono):
+        try:
+            with open(job_item.stderr, "wb") as stderr:
+                stderr.write((str(exc) + "\n").encode())
+        except OSError:
+            JobsExecutor.log(f"ERROR: Job Item \"{job_item.name}\": {exc}")
+
+        JobsExecutor.end_job(job_item, "FAILED", 127, start_mono)
+
+    #--------------------------------------------------------------------------
+    # Function: execute_async
+    # Execute job items in parallel up to the max number of threads using a
+    # single asyncio event loop rather than a pool of worker processes.
+    #
+    # Parameters:
+    # job_items   - List of job items
+    # num_threads - Number of parallel job items
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def execute_async(job_items, num_threads):
+
+        # Before Python 3.12 asyncio waits on each child process from its own
+        # thread.  When pidfds are supported, have the event loop poll them
+        # instead so that a single thread monitors all running job items.
+        if sys.version_info < (3, 12) and JobsExecutor.pidfd_supported():
+            asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+        asyncio.run(JobsExecutor.execute_jobs_async(job_items, num_threads))
+
+    #--------------------------------------------------------------------------
+    # Function: pidfd_supported
+    # Determine if process file descriptors are supported by Python and the
+    # running kernel (Linux 5.3+).
+    #
+    # Returns:
+    # bool - True if pidfds are supported
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def pidfd_supported():
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+        except (AttributeError, OSError):
+            return False
+        return True
+
+    #--------------------------------------------------------------------------
+    # Function: execute_jobs_async
+    # Coroutine that executes job items, the semaphore limits the number of
+    # running job items.
+    #
+    # Parameters:
+    # job_items   - List of job items
+    # num_threads - Number of parallel job items
+    #--------------------------------------------------------------------------
+    @staticmethod
+    async def execute_jobs_async(job_items, num_threads):
+        semaphore = asyncio.Semaphore(num_threads)
+        results = await asyncio.gather(
+            *(JobsExecutor.execute_job_async(job, semaphore) for job in job_items),
+            return_exceptions=True
+        )
+
+        # Report the first error only once all other job items have completed
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    #--------------------------------------------------------------------------
+    # Function: execute_job_async
+    # Coroutine that executes a job item.
+    #
+    # Parameters:
+    # job_item  - Job Item to Execute
+    # semaphore - Semaphore limiting the number of running job items
+    #--------------------------------------------------------------------------
+    @staticmethod
+    async def execute_job_async(job_item, semaphore):
+        async with semaphore:
+            start_mono = JobsExecutor.start_job(job_item)
+
+            # Execute Job Item
+            try:
+                argv, stdout, stderr = JobsExecutor.prepare_job(job_item)
+                try:
+                    p = await asyncio.create_subprocess_exec(
+                        *argv, stdout=stdout, stderr=stderr, start_new_session=True
+                    )
+                finally:
+                    stdout.close()
+                    stderr.close()
+            except Exception as exc:
+                JobsExecutor.fail_job(job_item, exc, start_mono)
+                return
+
+            # Handle Time-outs and terminations
+            try:
+                wall_time = int(job_item.wall_time)
+                await asyncio.wait_for(p.wait(), wall_time)
+                job_state = "COMPLETED"
+            except asyncio.TimeoutError:
+                JobsExecutor.kill_job(p.pid)
+                await p.wait()
+                job_state = "TIMEOUT"
+            except asyncio.CancelledError:
+                JobsExecutor.kill_job(p.pid)
+                await p.wait()
+                raise
+            except Exception as exc:
+                JobsExecutor.kill_job(p.pid)
+                await p.wait()
+                JobsExecutor.fail_job(job_item, exc, start_mono)
+                return
+
+            JobsExecutor.end_job(job_item, job_state, p.returncode, start_mono)
+
+    #--------------------------------------------------------------------------
+    # Function: start_job
+    # Mark a job item as executing and report it to the console.
+    #
+    # Parameters:
+    # job_item - Job Item being executed
+    #
+    # Returns:
+    # float - Monotonic clock time the job item started
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def start_job(job_item):
+        job_item.start_time = datetime.datetime.now()
+        start_mono = time.monotonic()
+        job_item.job_state  = "EXECUTING"
 
         # Update console message
-        time_delta = job_item.end_time - job_item.start_time
-        secs = int(time_delta.total_seconds())
-        mins = secs // 60
-        hrs = mins // 60
-        time_delta = "%02d:%02d:%02d" % (hrs, (mins%60), (secs%60))
+        msg = (
+            f"[{job_item.start_time}] {{job_state: {job_item.job_state}"
+            f", job: {job_item.name}, command: {job_item.command}}}"
+        )
+        JobsExecutor.log(msg)
 
-        msg  = "[" + str(job_item.end_time) + "] "
-        msg += "{job_state: " + "%-10s" % (job_state + ",")
-        msg += " job: " + job_item.name
-        msg += ", exit_code: " + str(job_item.exit_code)
-        msg += ", run_time: " + time_delta + "}"
-        print(msg)
+        return start_mono
+
+    #--------------------------------------------------------------------------
+    # Function: end_job
+    # Capture the end of job state and report it to the console.
+    #
+    # Parameters:
+    # job_item   - Job Item that was executed
+    # job_state  - Final job state
+    # exit_code  - Exit code of the job item
+    # start_mono - Monotonic clock time the job item started
+    #--------------------------------------------------------------------------
+    @staticmethod
+    def end_job(job_item, job_state, exit_code, start_mono):
+        job_item.end_time  = datetime.datetime.now()
+        job_item.exit_code = exit_code
+        job_item.job_state = job_state
+
+        # Update console message
+        mins, secs = divmod(int(time.monotonic() - start_mono), 60)
+        hrs, mins = divmod(mins, 60)
+        time_delta = f"{hrs:02d}:{mins:02d}:{secs:02d}"
+
+        msg = (
+            f"[{job_item.end_time}] {{job_state: {job_state + ',':<10}"
+            f" job: {job_item.name}, exit_code: {job_item.exit_code}"
+            f", run_time: {time_delta}}}"
+        )
+        JobsExecutor.log(msg)
 
 
 #------------------------------------------------------------------------------
@@ -509,9 +879,7 @@ def main():
     settings = GlobalSettings.load(data_map)
 
     # Parse the job items
-    pre_job_items  = JobsParser.parse(data_map, "pre_job_items", settings)
-    job_items      = JobsParser.parse(data_map, "job_items", settings)
-    post_job_items = JobsParser.parse(data_map, "post_job_items", settings)
+    pre_job_items, job_items, post_job_items = JobsParser.parse_all(data_map, settings)
 
     # Schedule/Order Job Items
     pre_job_items  = JobsScheduler.sequential_schedule(pre_job_items)
@@ -524,13 +892,19 @@ def main():
     else:
         job_items = JobsScheduler.priority_schedule(job_items)
 
+    # Select the Job Items executor
+    if (settings.executor == "async"):
+        execute = JobsExecutor.execute_async
+    else:
+        execute = JobsExecutor.execute
+
     # Execute Job Items
-    print ("\nPre Job Items:")
-    JobsExecutor.execute(pre_job_items, 1)
-    print ("\nJob Items:")
-    JobsExecutor.execute(job_items, settings.threads)
-    print ("\nPost Job Items:")
-    JobsExecutor.execute(post_job_items, 1)
+    JobsExecutor.log("\nPre Job Items:")
+    execute(pre_job_items, 1)
+    JobsExecutor.log("\nJob Items:")
+    execute(job_items, settings.threads)
+    JobsExecutor.log("\nPost Job Items:")
+    execute(post_job_items, 1)
     return
 
 